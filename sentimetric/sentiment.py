@@ -20,13 +20,40 @@ LLM usage:
 __version__ = "1.0.0"
 __all__ = ['analyze', 'analyze_batch', 'SentimentResult', 'Analyzer', 'LLMAnalyzer', 'compare_methods']
 
+import os
 import re
-from typing import List, Dict, Union, Optional
+import sys
+import json
+import time
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from array import array
+from types import MappingProxyType
+from typing import List, Dict, Tuple, Union, Optional
 from dataclasses import dataclass, asdict
-from collections import Counter
+from functools import lru_cache
+from collections import Counter, OrderedDict
 
+try:
+    import yaml
+except ImportError:  # YAML config files are optional
+    yaml = None
 
-@dataclass
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson only speeds up parsing LLM responses
+    _json_loads = json.loads
+
+# Markdown code fences some models wrap their JSON in
+_CODE_FENCE_RE = re.compile(r'```(?:json)?')
+
+# Slotted dataclasses need Python 3.10+; older versions keep a per-instance __dict__
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class SentimentResult:
     """
     Result of sentiment analysis
@@ -71,6 +98,16 @@ class SentimentResult:
         return self.category in ['neutral', 'mixed']
 
 
+def _copy_result(result: SentimentResult) -> SentimentResult:
+    """Copy a result so cached entries can't be mutated through callers"""
+    return SentimentResult(
+        result.polarity, result.category, result.confidence, result.subjectivity,
+        result.method, result.reasoning,
+        list(result.emotions) if result.emotions is not None else None,
+        result.tone,
+    )
+
+
 class Analyzer:
     """
     Fast rule-based sentiment analyzer
@@ -79,142 +116,217 @@ class Analyzer:
     Limitations: May miss sarcasm, complex emotions, subtle context
     """
     
-    def __init__(self):
-        # Sentiment lexicons with intensity scores
-        self.positive_words = {
-            'amazing': 0.9, 'awesome': 0.9, 'excellent': 0.9, 'perfect': 0.9,
-            'outstanding': 0.9, 'incredible': 0.9, 'fantastic': 0.9, 'brilliant': 0.9,
-            'wonderful': 0.9, 'spectacular': 0.9, 'phenomenal': 0.9, 'superb': 0.9,
-            'great': 0.7, 'good': 0.6, 'nice': 0.5, 'love': 0.8, 'like': 0.5,
-            'enjoy': 0.6, 'helpful': 0.6, 'useful': 0.6, 'cool': 0.6,
-            'impressive': 0.7, 'beautiful': 0.7, 'happy': 0.7, 'glad': 0.6,
-            'thanks': 0.6, 'thank': 0.6, 'best': 0.8,
-        }
-        
-        self.negative_words = {
-            'terrible': -0.9, 'horrible': -0.9, 'awful': -0.9, 'disgusting': -0.9,
-            'pathetic': -0.9, 'useless': -0.8, 'waste': -0.8, 'garbage': -0.8,
-            'trash': -0.8, 'worst': -0.9, 'hate': -0.8, 'disaster': -0.8,
-            'bad': -0.6, 'poor': -0.6, 'wrong': -0.5, 'disappointing': -0.7,
-            'disappointed': -0.7, 'boring': -0.6, 'confusing': -0.5, 'confused': -0.5,
-            'sucks': -0.7, 'shit': -0.7, 'crap': -0.7,
-        }
-        
-        # Modern slang (positive context)
-        self.slang_positive = {
-            'insane': 0.8, 'crazy': 0.7, 'sick': 0.8, 'fire': 0.9,
-            'lit': 0.8, 'dope': 0.7, 'goat': 0.9, 'beast': 0.8,
-            'savage': 0.7, 'slaps': 0.8, 'vibes': 0.6, 'based': 0.6,
-            # Additional modern slang from user's list
-            'unreal': 0.75, 'mental': 0.65, 'banger': 0.9, 'bussin': 0.9,
-            'hits different': 0.9, 'goes hard': 0.9, 'clean': 0.75, 'crisp': 0.75,
-            'fresh': 0.75, 'w': 0.9, 'dub': 0.9, 'goated': 0.9, "chef's kiss": 0.9,
-            'chefs kiss': 0.9, 'highkey': 0.75, 'fr fr': 0.65, 'no cap': 0.65,
-            'frfr': 0.65, 'ong': 0.65, 'deadass': 0.65, 'facts': 0.6,
-            'periodt': 0.65, 'period': 0.6, 'sheesh': 0.9, 'sheeesh': 1.0,
-        }
-        
-        # Modern slang (negative context) - new from user's list
-        self.slang_negative = {
-            'l': -0.9, 'mid': -0.75, 'mid af': -0.9, 'trash': -0.9,
-            'garbage': -0.9, 'ass': -0.75, 'cringe': -0.9, 'yikes': -0.75,
-            'oof': -0.65, 'rip': -0.5, 'cap': -0.75, 'sus': -0.5,
-            'sketch': -0.6, 'sketchy': -0.6, 'whack': -0.75, 'wack': -0.75,
-            'flop': -0.9, 'flopped': -0.9,
-        }
-        
-        self.intensifiers = {
-            'very': 1.3, 'really': 1.3, 'extremely': 1.5, 'absolutely': 1.5,
-            'incredibly': 1.5, 'so': 1.2, 'super': 1.4, 'ultra': 1.4,
-            # Additional intensifiers from user's list
-            'completely': 1.8, 'totally': 1.8, 'utterly': 1.8, 'amazingly': 2.0,
-            'exceptionally': 2.0, 'particularly': 1.5, 'especially': 1.5,
-            'truly': 1.5, 'genuinely': 1.5, 'literally': 1.5, 'quite': 1.3,
-            'pretty': 1.3, 'fairly': 1.2, 'rather': 1.2, 'somewhat': 1.1,
-            'kinda': 1.1, 'kind of': 1.1, 'sort of': 1.1,
-        }
+    # Category codes used by analyze_batch_arrays()
+    CATEGORY_CODES = {'neutral': 0, 'positive': 1, 'negative': 2}
+    
+    # Lexicons are read-only and shared by all instances. Subclasses may
+    # override them; __init__ builds its lookup tables from self.
+    
+    # Sentiment lexicons with intensity scores
+    positive_words = MappingProxyType({
+        'amazing': 0.9, 'awesome': 0.9, 'excellent': 0.9, 'perfect': 0.9,
+        'outstanding': 0.9, 'incredible': 0.9, 'fantastic': 0.9, 'brilliant': 0.9,
+        'wonderful': 0.9, 'spectacular': 0.9, 'phenomenal': 0.9, 'superb': 0.9,
+        'great': 0.7, 'good': 0.6, 'nice': 0.5, 'love': 0.8, 'like': 0.5,
+        'enjoy': 0.6, 'helpful': 0.6, 'useful': 0.6, 'cool': 0.6,
+        'impressive': 0.7, 'beautiful': 0.7, 'happy': 0.7, 'glad': 0.6,
+        'thanks': 0.6, 'thank': 0.6, 'best': 0.8,
+    })
+    
+    negative_words = MappingProxyType({
+        'terrible': -0.9, 'horrible': -0.9, 'awful': -0.9, 'disgusting': -0.9,
+        'pathetic': -0.9, 'useless': -0.8, 'waste': -0.8, 'garbage': -0.8,
+        'trash': -0.8, 'worst': -0.9, 'hate': -0.8, 'disaster': -0.8,
+        'bad': -0.6, 'poor': -0.6, 'wrong': -0.5, 'disappointing': -0.7,
+        'disappointed': -0.7, 'boring': -0.6, 'confusing': -0.5, 'confused': -0.5,
+        'sucks': -0.7, 'shit': -0.7, 'crap': -0.7,
+    })
+    
+    # Modern slang (positive context)
+    slang_positive = MappingProxyType({
+        'insane': 0.8, 'crazy': 0.7, 'sick': 0.8, 'fire': 0.9,
+        'lit': 0.8, 'dope': 0.7, 'goat': 0.9, 'beast': 0.8,
+        'savage': 0.7, 'slaps': 0.8, 'vibes': 0.6, 'based': 0.6,
+        # Additional modern slang from user's list
+        'unreal': 0.75, 'mental': 0.65, 'banger': 0.9, 'bussin': 0.9,
+        'hits different': 0.9, 'goes hard': 0.9, 'clean': 0.75, 'crisp': 0.75,
+        'fresh': 0.75, 'w': 0.9, 'dub': 0.9, 'goated': 0.9, "chef's kiss": 0.9,
+        'chefs kiss': 0.9, 'highkey': 0.75, 'fr fr': 0.65, 'no cap': 0.65,
+        'frfr': 0.65, 'ong': 0.65, 'deadass': 0.65, 'facts': 0.6,
+        'periodt': 0.65, 'period': 0.6, 'sheesh': 0.9, 'sheeesh': 1.0,
+    })
+    
+    # Modern slang (negative context) - new from user's list
+    slang_negative = MappingProxyType({
+        'l': -0.9, 'mid': -0.75, 'mid af': -0.9, 'trash': -0.9,
+        'garbage': -0.9, 'ass': -0.75, 'cringe': -0.9, 'yikes': -0.75,
+        'oof': -0.65, 'rip': -0.5, 'cap': -0.75, 'sus': -0.5,
+        'sketch': -0.6, 'sketchy': -0.6, 'whack': -0.75, 'wack': -0.75,
+        'flop': -0.9, 'flopped': -0.9,
+    })
+    
+    intensifiers = MappingProxyType({
+        'very': 1.3, 'really': 1.3, 'extremely': 1.5, 'absolutely': 1.5,
+        'incredibly': 1.5, 'so': 1.2, 'super': 1.4, 'ultra': 1.4,
+        # Additional intensifiers from user's list
+        'completely': 1.8, 'totally': 1.8, 'utterly': 1.8, 'amazingly': 2.0,
+        'exceptionally': 2.0, 'particularly': 1.5, 'especially': 1.5,
+        'truly': 1.5, 'genuinely': 1.5, 'literally': 1.5, 'quite': 1.3,
+        'pretty': 1.3, 'fairly': 1.2, 'rather': 1.2, 'somewhat': 1.1,
+        'kinda': 1.1, 'kind of': 1.1, 'sort of': 1.1,
+    })
+    
+    diminishers = MappingProxyType({
+        'slightly': 0.5, 'somewhat': 0.5, 'fairly': 0.6, 'rather': 0.6,
+        'pretty': 0.7, 'quite': 0.7, 'kinda': 0.5, 'sorta': 0.5,
+        # Additional reducers from user's list
+        'barely': 0.5, 'hardly': 0.5, 'a bit': 0.8, 'a little': 0.8,
+        'mildly': 0.8,
+    })
+    
+    negations = frozenset({
+        'not', 'no', 'never', 'neither', 'nobody', 'nothing',
+        "don't", "doesn't", "didn't", "can't", "won't", "shouldn't",
+        "isn't", "aren't", "wasn't", "weren't", "hasn't", "haven't",
+        'without', 'lack',
+        # Additional negations from user's list
+        'none', 'nowhere', 'cannot', 'wouldn\'t', 'couldn\'t', 'hadn\'t',
+        'doesn\'t', 'don\'t', 'didn\'t', 'ain\'t', 'barely', 'hardly',
+        'scarcely', 'rarely', 'seldom',
+    })
+    
+    # Negation scope terminators
+    negation_terminators = (
+        'but', 'however', 'although', 'though', 'yet', 'except',
+        '.', '!', '?', ',', ';'
+    )
+    
+    # Sarcasm indicators
+    sarcasm_indicators = (
+        # Explicit markers
+        '/s', '/sarcasm', '(sarcasm)', 
+        
+        # Phrases that are often sarcastic
+        'oh great',
+        'oh wonderful',
+        'just what i needed',
+        'exactly what i wanted',
+        'my favorite',
+        'i love how',
+        'love how',
+        'thanks for',
+        'really appreciate',
+        
+        # With positive words but negative context
+        'wonderful!',
+        'fantastic!',
+        'perfect!',
+        'great!',
+        'excellent!',
+        'brilliant!',
+        'amazing!',
+    )
+    
+    # Emojis that often indicate sarcasm
+    sarcasm_emojis = frozenset({'🙄', '😒', '🙃', '👏', '👍'})
+    
+    # Emojis
+    emoji_positive = MappingProxyType({
+        '😊': 0.7, '😀': 0.7, '😃': 0.7, '😄': 0.7, '😁': 0.7,
+        '😍': 0.9, '🥰': 0.9, '😘': 0.8, '❤️': 0.8, '💕': 0.8,
+        '👍': 0.7, '👏': 0.7, '🙌': 0.8, '✨': 0.6, '⭐': 0.6,
+        '🔥': 0.8, '💯': 0.8, '🎉': 0.7, '😂': 0.6, '🤣': 0.6,
+        # Additional positive emojis from user's list
+        '🙂': 0.5, '😌': 0.5, '🥰': 0.9, '😘': 0.8, '💖': 0.8,
+        '💗': 0.8, '💓': 0.8, '⚡': 0.75, '💪': 0.75, '🎊': 0.7,
+        '🏆': 0.8, '🥇': 0.8, '🌟': 0.6,
+    })
+    
+    emoji_negative = MappingProxyType({
+        '😢': -0.7, '😭': -0.7, '😞': -0.6, '😔': -0.6, '😠': -0.8,
+        '😡': -0.9, '🤬': -0.9, '💔': -0.8, '👎': -0.7, '😒': -0.6,
+        '🙄': -0.4,
+        # Additional negative emojis from user's list
+        '😥': -0.65, '😓': -0.55, '😟': -0.55, '😕': -0.4,
+        '😤': -0.75, '😑': -0.4, '💀': -0.4,
+    })
+    
+    # Context-dependent emojis (can be positive or negative)
+    emoji_context_dependent = MappingProxyType({
+        '🙃': -0.75,  # Upside down smile - usually indicates problems
+        '😬': -0.4,   # Grimacing
+        '🤡': -0.9,   # Clown - self-deprecating or mocking
+    })
+    
+    def __init__(self, cache_size: Optional[int] = 4096):
+        """
+        Initialize rule-based analyzer
         
-        self.diminishers = {
-            'slightly': 0.5, 'somewhat': 0.5, 'fairly': 0.6, 'rather': 0.6,
-            'pretty': 0.7, 'quite': 0.7, 'kinda': 0.5, 'sorta': 0.5,
-            # Additional reducers from user's list
-            'barely': 0.5, 'hardly': 0.5, 'a bit': 0.8, 'a little': 0.8,
-            'mildly': 0.8,
+        Args:
+            cache_size: Number of recent results to keep, keyed by text (0 or None disables
+                caching)
+        """
+        # Compiled once so analyze() doesn't go through the re module cache
+        self._token_re = re.compile(r'\b\w+\b')
+        
+        # ASCII fast path for tokenizing: map every non-word character to a
+        # space so str.split() yields exactly the regex's \w+ runs
+        self._ascii_split_table = str.maketrans({
+            chr(c): ' ' for c in range(128) if not (chr(c).isalnum() or chr(c) == '_')
+        })
+        
+        # Merged word score tables so each token costs a single lookup.
+        # Slang negatives take precedence over the regular lexicons, and
+        # positive slang only counts when the text has a positive context.
+        word_scores = {**self.positive_words, **self.negative_words, **self.slang_negative}
+        self._word_scores = {
+            word: score for word, score in word_scores.items()
+            if word not in self.slang_positive
         }
+        self._word_scores_slang = {**self._word_scores, **self.slang_positive}
         
-        self.negations = {
-            'not', 'no', 'never', 'neither', 'nobody', 'nothing',
-            "don't", "doesn't", "didn't", "can't", "won't", "shouldn't",
-            "isn't", "aren't", "wasn't", "weren't", "hasn't", "haven't",
-            'without', 'lack',
-            # Additional negations from user's list
-            'none', 'nowhere', 'cannot', 'wouldn\'t', 'couldn\'t', 'hadn\'t',
-            'doesn\'t', 'don\'t', 'didn\'t', 'ain\'t', 'barely', 'hardly',
-            'scarcely', 'rarely', 'seldom',
+        # Merged emoji table, same precedence as checking positive, negative,
+        # then context-dependent emojis in turn
+        self._emoji_scores = {
+            **self.emoji_context_dependent, **self.emoji_negative, **self.emoji_positive
         }
         
-        # Negation scope terminators
-        self.negation_terminators = [
-            'but', 'however', 'although', 'though', 'yet', 'except',
-            '.', '!', '?', ',', ';'
-        ]
-        
-        # Sarcasm indicators
-        self.sarcasm_indicators = [
-            # Explicit markers
-            '/s', '/sarcasm', '(sarcasm)', 
-            
-            # Phrases that are often sarcastic
-            'oh great',
-            'oh wonderful',
-            'just what i needed',
-            'exactly what i wanted',
-            'my favorite',
-            'i love how',
-            'love how',
-            'thanks for',
-            'really appreciate',
-            
-            # With positive words but negative context
-            'wonderful!',
-            'fantastic!',
-            'perfect!',
-            'great!',
-            'excellent!',
-            'brilliant!',
-            'amazing!',
-        ]
+        # One character class covering every emoji we react to, so finding
+        # them in non-ASCII text is a single C-level scan. Multi-codepoint
+        # keys never match a single character and are left out.
+        self._sarcasm_emoji_set = frozenset(self.sarcasm_emojis)
+        emoji_chars = sorted(
+            c for c in self._emoji_scores.keys() | self._sarcasm_emoji_set if len(c) == 1
+        )
+        # An empty class isn't valid regex; subclasses may drop every emoji
+        self._emoji_re = (
+            re.compile('[' + ''.join(map(re.escape, emoji_chars)) + ']') if emoji_chars else None
+        )
         
-        # Emojis that often indicate sarcasm
-        self.sarcasm_emojis = ['🙄', '😒', '🙃', '👏', '👍']
-        
-        # Emojis
-        self.emoji_positive = {
-            '😊': 0.7, '😀': 0.7, '😃': 0.7, '😄': 0.7, '😁': 0.7,
-            '😍': 0.9, '🥰': 0.9, '😘': 0.8, '❤️': 0.8, '💕': 0.8,
-            '👍': 0.7, '👏': 0.7, '🙌': 0.8, '✨': 0.6, '⭐': 0.6,
-            '🔥': 0.8, '💯': 0.8, '🎉': 0.7, '😂': 0.6, '🤣': 0.6,
-            # Additional positive emojis from user's list
-            '🙂': 0.5, '😌': 0.5, '🥰': 0.9, '😘': 0.8, '💖': 0.8,
-            '💗': 0.8, '💓': 0.8, '⚡': 0.75, '💪': 0.75, '🎊': 0.7,
-            '🏆': 0.8, '🥇': 0.8, '🌟': 0.6,
-        }
+        # Words that change how the following words are scored, mapped to
+        # (negates, multiplier). Built so negations win over intensifiers
+        # and intensifiers over diminishers, matching the old check order.
+        self._modifiers = {word: (False, mult) for word, mult in self.diminishers.items()}
+        self._modifiers.update((word, (False, mult)) for word, mult in self.intensifiers.items())
+        self._modifiers.update((word, (True, 1.0)) for word in self.negations)
         
-        self.emoji_negative = {
-            '😢': -0.7, '😭': -0.7, '😞': -0.6, '😔': -0.6, '😠': -0.8,
-            '😡': -0.9, '🤬': -0.9, '💔': -0.8, '👎': -0.7, '😒': -0.6,
-            '🙄': -0.4,
-            # Additional negative emojis from user's list
-            '😥': -0.65, '😓': -0.55, '😟': -0.55, '😕': -0.4,
-            '😤': -0.75, '😑': -0.4, '💀': -0.4,
-        }
+        # Words that can affect the score at all; everything else is filler
+        self._relevant_words = frozenset(self._modifiers.keys() | self._word_scores_slang.keys())
         
-        # Context-dependent emojis (can be positive or negative)
-        self.emoji_context_dependent = {
-            '🙃': -0.75,  # Upside down smile - usually indicates problems
-            '😬': -0.4,   # Grimacing
-            '🤡': -0.9,   # Clown - self-deprecating or mocking
-        }
+        # lru_cache treats None as unbounded; here it means no cache, as in LLMAnalyzer
+        self._cache_size = cache_size or 0
+        self._cached_analyze = lru_cache(maxsize=self._cache_size)(self._analyze_uncached)
+    
+    def __getstate__(self):
+        # The lru_cache wrapper holds a bound method and can't be pickled;
+        # it is rebuilt empty on the other side (e.g. in batch workers)
+        state = self.__dict__.copy()
+        del state['_cached_analyze']
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._cached_analyze = lru_cache(maxsize=self._cache_size)(self._analyze_uncached)
     
     def analyze(self, text: str) -> SentimentResult:
         """
@@ -226,11 +338,45 @@ class Analyzer:
         Returns:
             SentimentResult with polarity, category, and confidence
         """
+        # Callers get their own copy so the cached result stays intact
+        return _copy_result(self._cached_analyze(text))
+    
+    def clear_cache(self):
+        """Drop all cached results"""
+        self._cached_analyze.cache_clear()
+    
+    def _analyze_uncached(self, text: str) -> SentimentResult:
+        """Run the rule-based analysis without consulting the cache"""
+        polarity, category, confidence, subjectivity = self._score_text(text)
+        return SentimentResult(
+            polarity=polarity,
+            category=category,
+            confidence=confidence,
+            subjectivity=subjectivity,
+            method='rule_based'
+        )
+    
+    def _score_text(self, text: str) -> Tuple[float, str, float, float]:
+        """Score text, returning (polarity, category, confidence, subjectivity)"""
         if not text or not text.strip():
-            return SentimentResult(0.0, 'neutral', 0.0, 0.0, 'rule_based')
+            return 0.0, 'neutral', 0.0, 0.0
         
         text_lower = text.lower()
-        words = re.findall(r'\b\w+\b', text_lower)
+        is_ascii = text.isascii()
+        if is_ascii:
+            words = text_lower.translate(self._ascii_split_table).split()
+        else:
+            words = self._token_re.findall(text_lower)
+        
+        # Punctuation and positive slang context only depend on the text,
+        # so work them out once up front
+        exclamations = text.count('!')
+        has_question = '?' in text
+        context_positive = (
+            exclamations > 0 or 'thank' in text_lower
+            or 'wow' in text_lower or 'omg' in text_lower
+        )
+        word_scores = self._word_scores_slang if context_positive else self._word_scores
         
         sentiment_score = 0.0
         sentiment_count = 0
@@ -244,87 +390,88 @@ class Analyzer:
                 sarcasm_detected = True
                 break
         
-        # Check for sarcasm emojis
-        for char in text:
-            if char in self.sarcasm_emojis:
-                sarcasm_detected = True
-                break
+        # Every emoji we know about is non-ASCII, so plain text can skip
+        # the emoji scan entirely
+        emojis = () if is_ascii or self._emoji_re is None else self._emoji_re.findall(text)
         
-        for word in words:
-            if word in self.negations:
-                negation_active = True
-                continue
-            
-            if word in self.intensifiers:
-                intensifier_mult = self.intensifiers[word]
-                continue
-            
-            if word in self.diminishers:
-                intensifier_mult = self.diminishers[word]
-                continue
-            
-            score = 0.0
-            
-            # Check slang (positive context)
-            if word in self.slang_positive:
-                context_positive = any(ind in text_lower for ind in ['!', 'thank', 'wow', 'omg'])
-                if context_positive:
-                    score = self.slang_positive[word]
-            
-            # Check slang (negative context)
-            elif word in self.slang_negative:
-                score = self.slang_negative[word]
-            
-            # Check regular words
-            elif word in self.positive_words:
-                score = self.positive_words[word]
-            elif word in self.negative_words:
-                score = self.negative_words[word]
-            
-            if score != 0.0:
-                score *= intensifier_mult
-                if negation_active:
-                    score = -score * 0.8
-                
+        # Check for sarcasm emojis
+        if emojis and not sarcasm_detected:
+            sarcasm_detected = not self._sarcasm_emoji_set.isdisjoint(emojis)
+        
+        modifiers = self._modifiers
+        if modifiers.keys().isdisjoint(words):
+            # Nothing to negate or intensify, so every hit scores at face
+            # value and the lookups can run through map() instead of the
+            # stateful loop below
+            for score in filter(None, map(word_scores.get, words)):
                 sentiment_score += score
                 sentiment_count += 1
-                intensifier_mult = 1.0
-                negation_active = False
+        else:
+            # Filler words never change the loop state, so drop them with a
+            # C-level filter and only walk modifiers and scored words
+            for word in filter(self._relevant_words.__contains__, words):
+                modifier = modifiers.get(word)
+                if modifier is not None:
+                    negates, mult = modifier
+                    if negates:
+                        negation_active = True
+                    else:
+                        intensifier_mult = mult
+                    continue
+                
+                score = word_scores.get(word, 0.0)
+                
+                if score != 0.0:
+                    score *= intensifier_mult
+                    if negation_active:
+                        score = -score * 0.8
+                    
+                    sentiment_score += score
+                    sentiment_count += 1
+                    intensifier_mult = 1.0
+                    negation_active = False
         
         # Check emojis
-        for char in text:
-            if char in self.emoji_positive:
-                sentiment_score += self.emoji_positive[char]
-                sentiment_count += 1
-            elif char in self.emoji_negative:
-                sentiment_score += self.emoji_negative[char]
-                sentiment_count += 1
-            elif char in self.emoji_context_dependent:
-                sentiment_score += self.emoji_context_dependent[char]
-                sentiment_count += 1
+        if emojis:
+            emoji_scores = self._emoji_scores
+            for char in emojis:
+                score = emoji_scores.get(char)
+                if score is not None:
+                    sentiment_score += score
+                    sentiment_count += 1
         
         # Exclamation boost
-        if text.count('!') > 0 and sentiment_score != 0:
-            boost = min(1 + (text.count('!') * 0.1), 1.3)
+        if exclamations > 0 and sentiment_score != 0:
+            boost = min(1 + (exclamations * 0.1), 1.3)
             sentiment_score *= boost
         
         # Question mark reduction
-        if '?' in text and sentiment_count > 0:
+        if has_question and sentiment_count > 0:
             sentiment_score *= 0.8
         
         # Sarcasm handling - flip sentiment if sarcasm detected
         if sarcasm_detected and sentiment_score > 0:
             sentiment_score = -sentiment_score * 0.7
         
-        # Normalize
+        # Normalize (clamps written out inline; this runs once per text)
         if sentiment_count > 0:
-            polarity = max(-1.0, min(1.0, sentiment_score / max(1, sentiment_count * 0.7)))
+            denominator = sentiment_count * 0.7
+            polarity = sentiment_score / denominator if denominator > 1 else sentiment_score
+            if polarity > 1.0:
+                polarity = 1.0
+            elif polarity < -1.0:
+                polarity = -1.0
         else:
             polarity = 0.0
         
-        # Subjectivity
+        # Share of words carrying sentiment
         word_count = len(words)
-        subjectivity = min(1.0, sentiment_count / max(1, word_count) * 2)
+        hit_ratio = sentiment_count / (word_count if word_count > 1 else 1)
+        
+        # Subjectivity
+        subjectivity = hit_ratio * 2
+        if subjectivity > 1.0:
+            subjectivity = 1.0
         
         # Category
         if polarity > 0.15:
@@ -334,25 +481,155 @@ class Analyzer:
         else:
             category = 'neutral'
         
-        # Confidence
-        confidence = min(1.0, (sentiment_count / max(1, word_count)) * 3)
-        confidence = max(0.3, confidence)  # Minimum confidence
+        # Confidence, with a minimum of 0.3
+        confidence = hit_ratio * 3
+        if confidence > 1.0:
+            confidence = 1.0
+        elif confidence < 0.3:
+            confidence = 0.3
         
         # Adjust confidence for sarcasm detection
         if sarcasm_detected:
-            confidence = min(confidence * 1.2, 1.0)
+            confidence *= 1.2
+            if confidence > 1.0:
+                confidence = 1.0
         
-        return SentimentResult(
-            polarity=round(polarity, 4),
-            category=category,
-            confidence=round(confidence, 4),
-            subjectivity=round(subjectivity, 4),
-            method='rule_based'
-        )
+        return round(polarity, 4), category, round(confidence, 4), round(subjectivity, 4)
+    
+    def analyze_batch(self, texts: List[str], n_jobs: int = 1) -> List[SentimentResult]:
+        """
+        Analyze multiple texts
+        
+        Args:
+            texts: List of texts to analyze
+            n_jobs: Number of worker processes; 1 runs in-process, negative values
+                count back from the number of CPUs (-1 uses all of them), 0 is invalid
+            
+        Returns:
+            List of SentimentResults
+        """
+        if n_jobs == 0:
+            raise ValueError("n_jobs must be non-zero")
+        if n_jobs < 0:
+            n_jobs = max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+        
+        if n_jobs == 1 or len(texts) < 2:
+            return [self.analyze(text) for text in texts]
+        
+        # Texts are independent, so hand each worker large contiguous chunks
+        chunksize = max(1, len(texts) // (n_jobs * 4))
+        with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_batch_worker,
+                                 initargs=(self,)) as executor:
+            return list(executor.map(_analyze_in_batch_worker, texts, chunksize=chunksize))
+    
+    def analyze_batch_arrays(self, texts: List[str]) -> Tuple[array, array, array]:
+        """
+        Analyze multiple texts into compact columns instead of result objects
+        
+        Useful for large batches where only the scores are needed. The arrays
+        support the buffer protocol, so e.g. ``numpy.frombuffer(polarity,
+        dtype=numpy.float32)`` wraps them without copying. Bypasses the cache.
+        
+        Args:
+            texts: List of texts to analyze
+            
+        Returns:
+            Tuple of (polarity, category, confidence) arrays; polarity and
+            confidence are float32, category holds codes from CATEGORY_CODES
+        """
+        polarity = array('f')
+        category = array('B')
+        confidence = array('f')
+        codes = self.CATEGORY_CODES
+        score_text = self._score_text
+        
+        for text in texts:
+            text_polarity, text_category, text_confidence, _ = score_text(text)
+            polarity.append(text_polarity)
+            category.append(codes[text_category])
+            confidence.append(text_confidence)
+        
+        return polarity, category, confidence
+
+
+# Per-process analyzer used by Analyzer.analyze_batch(n_jobs=...)
+_batch_worker_analyzer: Optional[Analyzer] = None
+
+
+def _init_batch_worker(analyzer: Analyzer):
+    global _batch_worker_analyzer
+    _batch_worker_analyzer = analyzer
+
+
+def _analyze_in_batch_worker(text: str) -> SentimentResult:
+    return _batch_worker_analyzer.analyze(text)
+
+
+def _expand_unique(texts: List[str], unique_texts: List[str],
+                   unique_results: List[SentimentResult]) -> List[SentimentResult]:
+    """Map results for deduplicated texts back onto the original order"""
+    by_text = dict(zip(unique_texts, unique_results))
+    results = []
+    seen = set()
+    for text in texts:
+        result = by_text[text]
+        if text in seen:
+            # Repeats get their own copy rather than sharing one object
+            result = _copy_result(result)
+        else:
+            seen.add(text)
+        results.append(result)
+    return results
+
+
+class _RateLimiter:
+    """Thread-safe limiter that spaces calls evenly at a fixed rate"""
+    
+    def __init__(self, calls_per_minute: float):
+        self.interval = 60.0 / calls_per_minute
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+    
+    def wait(self):
+        """Block until the caller's slot comes up"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class _LRUCache:
+    """Small thread-safe LRU cache for LLM results keyed by model and text digest"""
+    
+    def __init__(self, maxsize: Optional[int]):
+        self.maxsize = maxsize or 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        if not self.maxsize:
+            return None
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
     
-    def analyze_batch(self, texts: List[str]) -> List[SentimentResult]:
-        """Analyze multiple texts"""
-        return [self.analyze(text) for text in texts]
+    def put(self, key, value):
+        if not self.maxsize:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._data.clear()
 
 
 class LLMAnalyzer:
@@ -422,7 +699,9 @@ class LLMAnalyzer:
     
     def __init__(self, provider: str = "auto", model: str = "auto", 
                  api_key: Optional[str] = None, fallback_to_cheaper: bool = True,
-                 config_file: Optional[str] = None):
+                 config_file: Optional[str] = None,
+                 requests_per_minute: Optional[float] = 300,
+                 cache_size: Optional[int] = 4096):
         """
         Initialize LLM analyzer with multi-provider support
         
@@ -432,14 +711,19 @@ class LLMAnalyzer:
             api_key: API key for the provider (optional, uses multiple resolution methods)
             fallback_to_cheaper: Whether to fall back to cheaper models if requested model fails
             config_file: Optional path to configuration file (JSON, YAML, or .env format)
+            requests_per_minute: Maximum rate of API calls, shared by all batch workers
+                (None disables rate limiting)
+            cache_size: Number of recent results to keep per model and text (0 or None
+                disables caching)
         """
-        import os
-        
         self.provider = provider.lower() if provider != "auto" else self._detect_best_provider()
         self.fallback_to_cheaper = fallback_to_cheaper
         self._client_initialized = False
         self._client = None
-        self._analyze_func = None
+        self._complete_func = None
+        self._google_models = {}
+        self._rate_limiter = _RateLimiter(requests_per_minute) if requests_per_minute else None
+        self._cache = _LRUCache(cache_size)
         
         if self.provider not in self.PROVIDERS:
             raise ValueError(f"Unknown provider: {provider}. Available: {list(self.PROVIDERS.keys())}")
@@ -469,6 +753,22 @@ class LLMAnalyzer:
   "tone": "<enthusiastic|sarcastic|grateful|critical|etc>"
 }
 
+Understand: modern slang, sarcasm, emojis, context, mixed emotions."""
+        
+        # System prompt for analyze_batch_packed(), several texts per request
+        self.batch_system_prompt = """Analyze the sentiment of each numbered text.
+Respond ONLY with a JSON array (no markdown) holding one object per text, in order:
+[
+  {
+    "polarity": <-1.0 to 1.0>,
+    "category": "<positive|negative|neutral|mixed>",
+    "confidence": <0.0 to 1.0>,
+    "reasoning": "<brief explanation>",
+    "emotions": ["<emotion1>", "<emotion2>"],
+    "tone": "<enthusiastic|sarcastic|grateful|critical|etc>"
+  }
+]
+
 Understand: modern slang, sarcasm, emojis, context, mixed emotions."""
     
     def _resolve_api_key(self, api_key: Optional[str], provider_info: dict, config_file: Optional[str]) -> Optional[str]:
@@ -482,8 +782,6 @@ Understand: modern slang, sarcasm, emojis, context, mixed emotions."""
         Returns:
             API key if found, None otherwise
         """
-        import os
-        
         # 1. Direct api_key parameter (supports multiple formats)
         if api_key is not None:
             # Parse API key from different formats
@@ -539,9 +837,6 @@ Understand: modern slang, sarcasm, emojis, context, mixed emotions."""
         Returns:
             Parsed API key string or None
         """
-        import os
-        import json
-        
         # If it's already a string, return it
         if isinstance(api_key_input, str):
             # Check if it's a file path (starts with @)
@@ -649,10 +944,6 @@ Understand: modern slang, sarcasm, emojis, context, mixed emotions."""
         Returns:
             API key if found in config, None otherwise
         """
-        import os
-        import json
-        import yaml
-        
         # Try default config file locations if not specified
         config_files_to_try = []
         if config_file:
@@ -696,7 +987,8 @@ Understand: modern slang, sarcasm, emojis, context, mixed emotions."""
                             return str(config[key])
                 
                 elif file_path.endswith(('.yaml', '.yml')):
-                    try:
+                    # Skipped when PyYAML isn't installed
+                    if yaml is not None:
                         with open(file_path, 'r') as f:
                             config = yaml.safe_load(f)
                         
@@ -712,9 +1004,6 @@ Understand: modern slang, sarcasm, emojis, context, mixed emotions."""
                             for key in possible_keys:
                                 if key in config:
                                     return str(config[key])
-                    except ImportError:
-                        # yaml not installed
-                        pass
                 
                 elif file_path.endswith('.env') or os.path.basename(file_path) == '.env':
                     # Parse .env file
@@ -738,8 +1027,6 @@ Understand: modern slang, sarcasm, emojis, context, mixed emotions."""
     
     def _detect_best_provider(self) -> str:
         """Detect the best available provider based on environment variables"""
-        import os
-        
         # Check for API keys in environment
         for provider, info in self.PROVIDERS.items():
             if os.getenv(info['env_var']):
@@ -778,28 +1065,28 @@ Understand: modern slang, sarcasm, emojis, context, mixed emotions."""
             if self.provider == 'openai':
                 import openai
                 self._client = openai.OpenAI(api_key=self.api_key)
-                self._analyze_func = self._analyze_openai
+                self._complete_func = self._complete_openai
                 
             elif self.provider == 'google':
                 import google.generativeai as genai
                 genai.configure(api_key=self.api_key)
                 self._client = genai
-                self._analyze_func = self._analyze_google
+                self._complete_func = self._complete_google
                 
             elif self.provider == 'anthropic':
                 import anthropic
                 self._client = anthropic.Anthropic(api_key=self.api_key)
-                self._analyze_func = self._analyze_anthropic
+                self._complete_func = self._complete_anthropic
                 
             elif self.provider == 'cohere':
                 import cohere
                 self._client = cohere.Client(self.api_key)
-                self._analyze_func = self._analyze_cohere
+                self._complete_func = self._complete_cohere
                 
             elif self.provider == 'huggingface':
                 from huggingface_hub import InferenceClient
                 self._client = InferenceClient(token=self.api_key)
-                self._analyze_func = self._analyze_huggingface
+                self._complete_func = self._complete_huggingface
                 
             elif self.provider == 'deepseek':
                 import openai
@@ -808,7 +1095,7 @@ Understand: modern slang, sarcasm, emojis, context, mixed emotions."""
                     api_key=self.api_key,
                     base_url="https://api.deepseek.com"
                 )
-                self._analyze_func = self._analyze_deepseek
+                self._complete_func = self._complete_deepseek
                 
             self._client_initialized = True
             
@@ -841,12 +1128,20 @@ Understand: modern slang, sarcasm, emojis, context, mixed emotions."""
         if not text or not text.strip():
             return SentimentResult(0.0, 'neutral', 0.0, 0.0, 'llm')
         
+        # Repeated texts are served from the cache instead of the API
+        cache_key = self._cache_key(text)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return _copy_result(cached)
+        
         # Ensure client is initialized
         if not self._client_initialized:
             self._init_provider_client()
         
         try:
-            return self._analyze_func(text)
+            result = self._call_provider(text)
+            self._cache.put(cache_key, _copy_result(result))
+            return result
         except Exception as e:
             # Try fallback to cheaper model if enabled
             if self.fallback_to_cheaper and self.model != self.PROVIDERS[self.provider]['cheapest']:
@@ -854,141 +1149,137 @@ Understand: modern slang, sarcasm, emojis, context, mixed emotions."""
                 original_model = self.model
                 self.model = self.PROVIDERS[self.provider]['cheapest']
                 try:
-                    # Re-initialize client with new model if needed
-                    if self.provider in ['openai', 'anthropic', 'cohere', 'huggingface', 'deepseek']:
-                        self._client_initialized = False
-                        self._init_provider_client()
-                    
-                    result = self._analyze_func(text)
+                    # The model is sent with each request, so the existing
+                    # client (and its pooled connections) is reused as-is
+                    result = self._call_provider(text)
                     result.method = f'llm_fallback({original_model}->{self.model})'
+                    self._cache.put(self._cache_key(text), _copy_result(result))
                     return result
                 except Exception as e2:
                     print(f"Cheaper model also failed: {e2}")
             
             # Fallback to rule-based analysis
             print(f"LLM error: {e}. Falling back to rule-based analysis.")
-            analyzer = Analyzer()
-            result = analyzer.analyze(text)
+            result = _get_default_analyzer().analyze(text)
             result.method = 'rule_based_fallback'
             return result
     
-    def _analyze_openai(self, text: str) -> SentimentResult:
-        """Analyze using OpenAI"""
-        import json
-        
+    def clear_cache(self):
+        """Drop all cached results"""
+        self._cache.clear()
+    
+    def _cache_key(self, text: str) -> tuple:
+        """Cache key for text under the current model"""
+        digest = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        return self.model, digest
+    
+    def _call_provider(self, text: str) -> SentimentResult:
+        """Analyze a single text with one provider API call"""
+        content = self._complete(self.system_prompt, f"Analyze: {text}", max_tokens=500)
+        return self._create_result(self._parse_json(content, '{'))
+    
+    def _complete(self, system_prompt: str, prompt: str, max_tokens: int) -> str:
+        """Issue one provider API call, respecting the rate limit"""
+        if self._rate_limiter is not None:
+            self._rate_limiter.wait()
+        return self._complete_func(system_prompt, prompt, max_tokens)
+    
+    def _complete_openai(self, system_prompt: str, prompt: str, max_tokens: int) -> str:
+        """Complete using OpenAI"""
         response = self._client.chat.completions.create(
             model=self.model,
             messages=[
-                {"role": "system", "content": self.system_prompt},
-                {"role": "user", "content": f"Analyze: {text}"}
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
             ],
             temperature=0.1,
-            max_tokens=500
+            max_tokens=max_tokens
         )
         
-        content = response.choices[0].message.content.strip()
-        content = content.replace('```json', '').replace('```', '').strip()
-        data = json.loads(content)
-        
-        return self._create_result(data)
+        return response.choices[0].message.content.strip()
     
-    def _analyze_google(self, text: str) -> SentimentResult:
-        """Analyze using Google Gemini"""
-        import json
-        
-        model = self._client.GenerativeModel(self.model)
+    def _complete_google(self, system_prompt: str, prompt: str, max_tokens: int) -> str:
+        """Complete using Google Gemini"""
+        model = self._google_models.get(self.model)
+        if model is None:
+            model = self._google_models[self.model] = self._client.GenerativeModel(self.model)
         response = model.generate_content(
-            f"{self.system_prompt}\n\nAnalyze: {text}",
+            f"{system_prompt}\n\n{prompt}",
             generation_config={
                 "temperature": 0.1,
-                "max_output_tokens": 500,
+                "max_output_tokens": max_tokens,
             }
         )
         
-        content = response.text.strip()
-        content = content.replace('```json', '').replace('```', '').strip()
-        data = json.loads(content)
-        
-        return self._create_result(data)
+        return response.text.strip()
     
-    def _analyze_anthropic(self, text: str) -> SentimentResult:
-        """Analyze using Anthropic Claude"""
-        import json
-        
+    def _complete_anthropic(self, system_prompt: str, prompt: str, max_tokens: int) -> str:
+        """Complete using Anthropic Claude"""
         response = self._client.messages.create(
             model=self.model,
-            max_tokens=500,
-            system=self.system_prompt,
-            messages=[{"role": "user", "content": f"Analyze: {text}"}]
+            max_tokens=max_tokens,
+            system=system_prompt,
+            messages=[{"role": "user", "content": prompt}]
         )
         
-        content = response.content[0].text.strip()
-        content = content.replace('```json', '').replace('```', '').strip()
-        data = json.loads(content)
-        
-        return self._create_result(data)
+        return response.content[0].text.strip()
     
-    def _analyze_cohere(self, text: str) -> SentimentResult:
-        """Analyze using Cohere"""
-        import json
-        
+    def _complete_cohere(self, system_prompt: str, prompt: str, max_tokens: int) -> str:
+        """Complete using Cohere"""
         response = self._client.chat(
             model=self.model,
-            message=f"Analyze: {text}",
-            preamble=self.system_prompt,
+            message=prompt,
+            preamble=system_prompt,
             temperature=0.1,
-            max_tokens=500
+            max_tokens=max_tokens
         )
         
-        content = response.text.strip()
-        content = content.replace('```json', '').replace('```', '').strip()
-        data = json.loads(content)
-        
-        return self._create_result(data)
+        return response.text.strip()
     
-    def _analyze_huggingface(self, text: str) -> SentimentResult:
-        """Analyze using Hugging Face"""
-        import json
-        
-        prompt = f"{self.system_prompt}\n\nAnalyze: {text}"
+    def _complete_huggingface(self, system_prompt: str, prompt: str, max_tokens: int) -> str:
+        """Complete using Hugging Face"""
         response = self._client.text_generation(
-            prompt,
+            f"{system_prompt}\n\n{prompt}",
             model=self.model,
-            max_new_tokens=500,
+            max_new_tokens=max_tokens,
             temperature=0.1
         )
         
-        # Extract JSON from response
-        content = response.strip()
-        # Try to find JSON in the response
-        start_idx = content.find('{')
-        end_idx = content.rfind('}') + 1
-        if start_idx != -1 and end_idx != 0:
-            content = content[start_idx:end_idx]
-        
-        data = json.loads(content)
-        
-        return self._create_result(data)
+        return response.strip()
     
-    def _analyze_deepseek(self, text: str) -> SentimentResult:
-        """Analyze using DeepSeek (OpenAI-compatible API)"""
-        import json
-        
+    def _complete_deepseek(self, system_prompt: str, prompt: str, max_tokens: int) -> str:
+        """Complete using DeepSeek (OpenAI-compatible API)"""
         response = self._client.chat.completions.create(
             model=self.model,
             messages=[
-                {"role": "system", "content": self.system_prompt},
-                {"role": "user", "content": f"Analyze: {text}"}
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
             ],
             temperature=0.1,
-            max_tokens=500
+            max_tokens=max_tokens
         )
         
-        content = response.choices[0].message.content.strip()
-        content = content.replace('```json', '').replace('```', '').strip()
-        data = json.loads(content)
+        return response.choices[0].message.content.strip()
+    
+    def _parse_json(self, content: str, opener: str):
+        """
+        Parse the JSON value from a provider response
+        
+        Args:
+            content: Raw response text
+            opener: '{' for an object or '[' for an array; only that bracket
+                pair is searched for, so asides in the other kind are skipped
+        """
+        content = _CODE_FENCE_RE.sub('', content).strip()
+        
+        # Some models wrap the JSON in prose; keep only the outermost value
+        if content[:1] != opener:
+            start_idx = content.find(opener)
+            end_idx = content.rfind('}' if opener == '{' else ']') + 1
+            if start_idx != -1 and end_idx > start_idx:
+                content = content[start_idx:end_idx]
         
-        return self._create_result(data)
+        return _json_loads(content)
     
     def _create_result(self, data: dict) -> SentimentResult:
         """Create SentimentResult from provider response"""
@@ -1007,6 +1298,10 @@ Understand: modern slang, sarcasm, emojis, context, mixed emotions."""
         """
         Analyze multiple texts with parallel processing
         
+        API calls from all workers go through the analyzer's shared rate
+        limiter, so workers only wait when the provider quota requires it.
+        Duplicate texts are only sent once.
+        
         Args:
             texts: List of texts to analyze
             max_workers: Number of parallel workers
@@ -1014,31 +1309,106 @@ Understand: modern slang, sarcasm, emojis, context, mixed emotions."""
         Returns:
             List of SentimentResults
         """
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-        import time
+        unique_texts = list(dict.fromkeys(texts))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            unique_results = list(executor.map(self.analyze, unique_texts))
+        return _expand_unique(texts, unique_texts, unique_results)
+    
+    def analyze_batch_packed(self, texts: List[str], batch_size: int = 10,
+                             max_workers: int = 5) -> List[SentimentResult]:
+        """
+        Analyze multiple texts, packing several texts into each API call
         
-        results = [None] * len(texts)
+        Cuts the number of requests (and their fixed latency) by roughly
+        batch_size. Cached and duplicate texts are not resent, and any group
+        whose response can't be matched back to its texts is retried one text
+        at a time.
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_idx = {
-                executor.submit(self._analyze_delayed, text, i * 0.2): i
-                for i, text in enumerate(texts)
-            }
+        Args:
+            texts: List of texts to analyze
+            batch_size: Number of texts per API call (at least 1)
+            max_workers: Number of parallel workers
             
-            for future in as_completed(future_to_idx):
-                idx = future_to_idx[future]
-                results[idx] = future.result()
+        Returns:
+            List of SentimentResults
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        
+        unique_texts = list(dict.fromkeys(texts))
+        results = [None] * len(unique_texts)
+        pending = []
+        for idx, text in enumerate(unique_texts):
+            if text and text.strip() and self._cache.get(self._cache_key(text)) is None:
+                pending.append(idx)
+            else:
+                results[idx] = self.analyze(text)
         
-        return results
+        if not pending:
+            return _expand_unique(texts, unique_texts, results)
+        
+        # Initialize up front so workers don't race to create the client
+        if not self._client_initialized:
+            self._init_provider_client()
+        
+        groups = [
+            [unique_texts[idx] for idx in pending[start:start + batch_size]]
+            for start in range(0, len(pending), batch_size)
+        ]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            group_results = [
+                result for group in executor.map(self._analyze_group, groups) for result in group
+            ]
+        
+        for idx, result in zip(pending, group_results):
+            results[idx] = result
+        return _expand_unique(texts, unique_texts, results)
     
-    def _analyze_delayed(self, text: str, delay: float) -> SentimentResult:
-        """Helper for rate limiting"""
-        import time
-        time.sleep(delay)
-        return self.analyze(text)
+    def _analyze_group(self, texts: List[str]) -> List[SentimentResult]:
+        """Analyze a group of texts with one packed request"""
+        if len(texts) == 1:
+            return [self.analyze(texts[0])]
+        
+        numbered = '\n'.join(
+            f"{n}. {json.dumps(text, ensure_ascii=False)}" for n, text in enumerate(texts, 1)
+        )
+        try:
+            content = self._complete(
+                self.batch_system_prompt,
+                f"Analyze these {len(texts)} texts:\n{numbered}",
+                # Roughly what a single analysis allows, capped for model limits
+                max_tokens=min(300 * len(texts), 4096)
+            )
+            data = self._parse_json(content, '[')
+            if (not isinstance(data, list) or len(data) != len(texts)
+                    or not all(isinstance(item, dict) for item in data)):
+                raise ValueError(f"expected a JSON array of {len(texts)} objects")
+            # Build every result before caching any, so one bad item can't leave a partial group
+            results = [self._create_result(item) for item in data]
+        except Exception as e:
+            print(f"Packed request failed: {e}. Analyzing texts individually.")
+            return [self.analyze(text) for text in texts]
+        
+        for text, result in zip(texts, results):
+            self._cache.put(self._cache_key(text), _copy_result(result))
+        return results
 
 
 # Convenience functions
+
+# Lexicons are only read after construction, so one shared rule-based
+# analyzer serves every convenience call instead of being rebuilt each time
+_default_analyzer: Optional[Analyzer] = None
+
+
+def _get_default_analyzer() -> Analyzer:
+    """Return the shared rule-based analyzer, creating it on first use"""
+    global _default_analyzer
+    if _default_analyzer is None:
+        _default_analyzer = Analyzer()
+    return _default_analyzer
+
+
 def analyze(text: str, method: str = 'auto') -> SentimentResult:
     """
     Quick sentiment analysis
@@ -1059,17 +1429,17 @@ def analyze(text: str, method: str = 'auto') -> SentimentResult:
         analyzer = LLMAnalyzer()
         return analyzer.analyze(text)
     else:
-        analyzer = Analyzer()
-        return analyzer.analyze(text)
+        return _get_default_analyzer().analyze(text)
 
 
-def analyze_batch(texts: List[str], method: str = 'rule') -> List[SentimentResult]:
+def analyze_batch(texts: List[str], method: str = 'rule', n_jobs: int = 1) -> List[SentimentResult]:
     """
     Batch sentiment analysis
     
     Args:
         texts: List of texts to analyze
         method: 'rule' (fast) or 'llm' (accurate)
+        n_jobs: Worker processes for rule-based analysis (-1 uses all CPUs)
         
     Returns:
         List of SentimentResults
@@ -1078,8 +1448,7 @@ def analyze_batch(texts: List[str], method: str = 'rule') -> List[SentimentResul
         analyzer = LLMAnalyzer()
         return analyzer.analyze_batch(texts)
     else:
-        analyzer = Analyzer()
-        return analyzer.analyze_batch(texts)
+        return _get_default_analyzer().analyze_batch(texts, n_jobs=n_jobs)
 
 
 def compare_methods(text: str, api_key: Optional[str] = None) -> Dict[str, SentimentResult]:
@@ -1093,8 +1462,7 @@ def compare_methods(text: str, api_key: Optional[str] = None) -> Dict[str, Senti
     Returns:
         Dictionary with 'rule_based' and 'llm' results
     """
-    rule_analyzer = Analyzer()
-    rule_result = rule_analyzer.analyze(text)
+    rule_result = _get_default_analyzer().analyze(text)
     
     try:
         llm_analyzer = LLMAnalyzer(api_key=api_key)
@@ -1255,8 +1623,6 @@ class Benchmark:
 
 def main():
     """CLI entry point"""
-    import sys
-    
     if len(sys.argv) > 1:
         if sys.argv[1] == 'benchmark':
             Benchmark.compare_analyzers()
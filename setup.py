@@ -56,12 +56,16 @@ setup(
         "deepseek": [
             "openai>=1.0.0",
         ],
+        "orjson": [
+            "orjson>=3.9.0",
+        ],
         "all": [
             "openai>=1.0.0",
             "google-generativeai>=0.3.0",
             "anthropic>=0.25.0",
             "cohere>=5.0.0",
             "huggingface-hub>=0.20.0",
+            "orjson>=3.9.0",
         ],
     },
     entry_points={
@@ -0,0 +1,50 @@
+"""Tests for multi-process batch analysis and Analyzer pickling"""
+
+import pickle
+
+import pytest
+
+from sentimetric import Analyzer, analyze_batch
+
+
+TEXTS = [
+    "This is amazing!",
+    "Worst purchase ever 😡",
+    "not bad at all",
+    "Oh great, another bug 🙄",
+    "",
+    "it's okay I guess",
+]
+
+
+class TestAnalyzeBatch:
+
+    def test_worker_processes_match_in_process_results(self):
+        expected = [result.to_dict() for result in analyze_batch(TEXTS)]
+
+        results = analyze_batch(TEXTS, n_jobs=2)
+
+        assert [result.to_dict() for result in results] == expected
+
+    def test_negative_n_jobs_counts_back_from_cpus(self):
+        expected = [result.to_dict() for result in Analyzer().analyze_batch(TEXTS)]
+
+        results = Analyzer().analyze_batch(TEXTS, n_jobs=-1)
+
+        assert [result.to_dict() for result in results] == expected
+
+    def test_rejects_zero_n_jobs(self):
+        with pytest.raises(ValueError, match="n_jobs must be non-zero"):
+            analyze_batch(TEXTS, n_jobs=0)
+
+
+class TestPickling:
+
+    def test_unpickled_analyzer_analyzes_with_empty_cache(self):
+        analyzer = Analyzer()
+        expected = analyzer.analyze("This is amazing!")
+
+        restored = pickle.loads(pickle.dumps(analyzer))
+
+        assert restored._cached_analyze.cache_info().currsize == 0
+        assert restored.analyze("This is amazing!") == expected
@@ -0,0 +1,19 @@
+"""Tests for the rule-based Analyzer"""
+
+from types import MappingProxyType
+
+from sentimetric import Analyzer
+
+
+class TestLexiconOverrides:
+
+    def test_subclass_without_emojis(self):
+        class NoEmojiAnalyzer(Analyzer):
+            emoji_positive = MappingProxyType({})
+            emoji_negative = MappingProxyType({})
+            emoji_context_dependent = MappingProxyType({})
+            sarcasm_emojis = frozenset()
+
+        result = NoEmojiAnalyzer().analyze("great stuff 😀")
+
+        assert result.category == 'positive'
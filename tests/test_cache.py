@@ -0,0 +1,76 @@
+"""Tests for Analyzer and LLMAnalyzer result caching"""
+
+import json
+
+from sentimetric import Analyzer, LLMAnalyzer
+
+
+REPLY = {'polarity': 0.5, 'category': 'positive', 'confidence': 0.9, 'emotions': ['joy']}
+
+
+def make_analyzer(**kwargs):
+    """LLMAnalyzer whose provider call is replaced by a stub counting prompts"""
+    analyzer = LLMAnalyzer(provider='openai', api_key='sk-test-1234567890',
+                           requests_per_minute=None, **kwargs)
+    analyzer._client_initialized = True
+    prompts = []
+
+    def complete(system_prompt, prompt, max_tokens):
+        prompts.append(prompt)
+        return json.dumps(REPLY)
+
+    analyzer._complete_func = complete
+    return analyzer, prompts
+
+
+class TestAnalyzerCache:
+
+    def test_none_disables_cache(self):
+        assert Analyzer(cache_size=None)._cached_analyze.cache_info().maxsize == 0
+
+    def test_returned_results_are_copies(self):
+        analyzer = Analyzer()
+        first = analyzer.analyze("This is amazing")
+        expected = first.to_dict()
+        first.polarity = -1.0
+        first.category = 'negative'
+
+        second = analyzer.analyze("This is amazing")
+
+        assert second.to_dict() == expected
+
+
+class TestLLMAnalyzerCache:
+
+    def test_repeated_text_calls_provider_once(self):
+        analyzer, prompts = make_analyzer()
+
+        analyzer.analyze("good")
+        analyzer.analyze("good")
+
+        assert len(prompts) == 1
+
+    def test_zero_cache_size_calls_provider_every_time(self):
+        analyzer, prompts = make_analyzer(cache_size=0)
+
+        analyzer.analyze("good")
+        analyzer.analyze("good")
+
+        assert len(prompts) == 2
+
+    def test_none_cache_size_calls_provider_every_time(self):
+        analyzer, prompts = make_analyzer(cache_size=None)
+
+        analyzer.analyze("good")
+        analyzer.analyze("good")
+
+        assert len(prompts) == 2
+
+    def test_mutating_emotions_does_not_change_cached_result(self):
+        analyzer, prompts = make_analyzer()
+        analyzer.analyze("good").emotions.append('anger')
+
+        result = analyzer.analyze("good")
+
+        assert len(prompts) == 1
+        assert result.emotions == ['joy']
@@ -0,0 +1,69 @@
+"""Tests for packed LLM batch analysis, using a stubbed provider call"""
+
+import json
+
+import pytest
+
+from sentimetric import LLMAnalyzer
+
+
+ITEM = {'polarity': 0.5, 'category': 'positive', 'confidence': 0.9}
+
+
+def make_analyzer(packed_reply):
+    """LLMAnalyzer whose provider call is replaced by a stub"""
+    analyzer = LLMAnalyzer(provider='openai', api_key='sk-test-1234567890',
+                           requests_per_minute=None)
+    analyzer._client_initialized = True
+    prompts = []
+
+    def complete(system_prompt, prompt, max_tokens):
+        prompts.append(prompt)
+        if prompt.startswith('Analyze these'):
+            return packed_reply
+        return json.dumps(dict(ITEM, reasoning=prompt))
+
+    analyzer._complete_func = complete
+    return analyzer, prompts
+
+
+class TestAnalyzeBatchPacked:
+
+    def test_reply_wrapped_in_prose_and_code_fence(self):
+        reply = "Sure! Here you go:\n```json\n" + json.dumps([ITEM, ITEM]) + "\n```\nHope that helps."
+        analyzer, prompts = make_analyzer(reply)
+
+        results = analyzer.analyze_batch_packed(['good', 'great'])
+
+        assert len(prompts) == 1
+        assert [r.category for r in results] == ['positive', 'positive']
+        assert [r.method for r in results] == ['llm_openai', 'llm_openai']
+
+    def test_single_reply_with_bracketed_aside_before_object(self):
+        analyzer, prompts = make_analyzer('[]')
+        analyzer._complete_func = lambda system_prompt, prompt, max_tokens: (
+            'The text mixes emotions [joy, frustration]. '
+            + json.dumps(dict(ITEM, emotions=['joy', 'frustration']))
+        )
+
+        result = analyzer.analyze('good but annoying')
+
+        assert result.method == 'llm_openai'
+        assert result.emotions == ['joy', 'frustration']
+
+    def test_bad_item_retries_texts_individually(self):
+        reply = json.dumps([ITEM, dict(ITEM, polarity=None)])
+        analyzer, prompts = make_analyzer(reply)
+
+        results = analyzer.analyze_batch_packed(['good', 'great'])
+
+        # Neither item is taken from the packed reply, even the valid one
+        assert prompts[1:] == ['Analyze: good', 'Analyze: great']
+        assert [r.reasoning for r in results] == ['Analyze: good', 'Analyze: great']
+
+    def test_rejects_non_positive_batch_size(self):
+        analyzer, prompts = make_analyzer('[]')
+
+        with pytest.raises(ValueError, match="batch_size must be >= 1"):
+            analyzer.analyze_batch_packed(['good'], batch_size=0)
+        assert prompts == []